@@ -1,11 +1,25 @@
-import random
 import hashlib
-from datetime import datetime, timedelta
-
+import io
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from decimal import Decimal
+from itertools import repeat
+
+import numpy as np
+from openpyxl import Workbook
 import pandas as pd
 import psycopg2
+from psycopg2.extensions import encodings
 from psycopg2.extras import execute_values
 
+try:
+    from pgcopy import CopyManager
+    from pgcopy.copy import numeric as numeric_formatter, str_formatter
+except ImportError:  # pgcopy es opcional; sin él se usa COPY en texto
+    CopyManager = None
+
 # ==========================
 # CONFIGURACIÓN GENERAL
 # ==========================
@@ -32,36 +46,181 @@ NUM_REGISTROS = 1000
 # Fecha y hora inicial de la simulación
 FECHA_INICIAL = datetime(2025, 1, 1, 8, 0, 0)  # 1 de enero 2025, 8:00 am
 
+# Formato del archivo de lecturas: "xlsx" (hoja de cálculo), "csv" o "parquet".
+# csv y parquet son mucho más rápidos si el archivo no se va a abrir en Excel
+# (parquet requiere pyarrow).
+FORMATO_SALIDA = "xlsx"
+
+# Método de carga en PostgreSQL: COPY (más rápido) o INSERT por lotes con execute_values.
+# Usa USAR_COPY = False si el usuario no puede ejecutar COPY.
+USAR_COPY = True
+
+# Con COPY, usar el formato binario de PostgreSQL si pgcopy está instalado
+# (evita que el servidor tenga que interpretar texto en las columnas numéricas)
+USAR_COPY_BINARIO = True
+
+# Filas por sentencia INSERT cuando no se usa COPY (por debajo de ~100 se pierde mucho rendimiento)
+TAMANO_PAGINA_INSERT = 1000
+
+# Consultar y mostrar los IDs de las tablas relacionadas antes de insertar (depuración)
+VALIDAR_IDS = False
+
+# Procesos para generar los registros en paralelo; sólo compensa con muchos registros
+NUM_PROCESOS = os.cpu_count() or 1
+MIN_REGISTROS_PARALELO = 1_000_000
+
+# Filas por bloque al calcular los hashes de integridad (cabe en la caché L1/L2)
+TAMANO_BLOQUE = 4096
+
+# Límites superiores (inclusive) de cada clasificación de ppm, en orden.
+# id_clasificacion: 1 Muy baja (<= 0.5), 2 Baja (<= 1), 3 Moderada (<= 10), 4 Alta (<= 50),
+# 5 Muy alta (<= 500), 6 Extremadamente peligrosa (> 500).
+# Ajusta los códigos 1..6 a los que tengas en tu tabla 'clasificacion_ppm'.
+UMBRALES_PPM = np.array([0.5, 1, 10, 50, 500])
+
+# Valor máximo de ppm simulado (las lecturas se redondean a 2 decimales)
+PPM_MAXIMO = 80
+
+# Tabla de clasificación precalculada: posición = ppm en centésimas (0 .. PPM_MAXIMO * 100)
+LUT_CLASIFICACION_PPM = (
+    np.searchsorted(UMBRALES_PPM * 100, np.arange(PPM_MAXIMO * 100 + 1)) + 1
+).astype(np.int8)
+
 # ==========================
 # FUNCIONES AUXILIARES
 # ==========================
 
-def clasificar_ppm(ppm: float) -> int:
+# La clasificación no se compila con Numba: ya no hay bucle por fila que compilar
+# (es una consulta vectorizada a la tabla), y el JIT sólo añadiría una dependencia
+# y su tiempo de arranque.
+def clasificar_ppm_vector(ppm: np.ndarray) -> np.ndarray:
     """
-    Devuelve un id_clasificacion entero según el rango de ppm.
-    Ajusta los códigos 1..6 a los que tengas en tu tabla 'clasificacion_ppm'.
+    Devuelve el id_clasificacion de cada valor de ppm según UMBRALES_PPM.
+    Los ppm con 2 decimales exactos entre 0 y PPM_MAXIMO se resuelven con una sola
+    consulta a LUT_CLASIFICACION_PPM indexada por centésimas de ppm; el resto, con
+    np.searchsorted.
     """
-    if ppm <= 0.5:
-        return 1  # Muy baja
-    elif ppm <= 1:
-        return 2  # Baja
-    elif ppm <= 10:
-        return 3  # Moderada
-    elif ppm <= 50:
-        return 4  # Alta
-    elif ppm <= 500:
-        return 5  # Muy alta
-    else:
-        return 6  # Extremadamente peligrosa
+    indices = np.rint(ppm * 100)
+    # Sólo valores que caen exactamente en la rejilla de centésimas (como los que deja
+    # np.round(..., 2)); redondear cualquier otro podría cambiarle la clasificación
+    en_rango = (indices >= 0) & (indices <= PPM_MAXIMO * 100) & (indices / 100 == ppm)
+    if en_rango.all():
+        return LUT_CLASIFICACION_PPM[indices.astype(np.int32)]
+
+    # Valores fuera de la tabla: se clasifican comparando con los umbrales
+    clasif = (np.searchsorted(UMBRALES_PPM, ppm) + 1).astype(np.int8)
+    clasif[en_rango] = LUT_CLASIFICACION_PPM[indices[en_rango].astype(np.int32)]
+    return clasif
 
 
-def generar_hash_integridad(row: dict) -> str:
+def generar_hash_integridad(df: pd.DataFrame) -> list:
     """
-    Genera un hash MD5 simple a partir de algunos campos clave.
+    Genera un hash MD5 simple por fila a partir de algunos campos clave.
     Esto es sólo para simular un control de integridad.
+    Se procesa por bloques de TAMANO_BLOQUE filas: las cadenas base de cada bloque
+    se arman por columnas y se hashean mientras siguen en caché.
     """
-    base_str = f"{row['fecha']}{row['hora']}{row['id_sensor']}{row['ppm_benceno']}"
-    return hashlib.md5(base_str.encode("utf-8")).hexdigest()
+    md5 = hashlib.md5
+    hashes = []
+    for inicio in range(0, len(df), TAMANO_BLOQUE):
+        bloque = df.iloc[inicio:inicio + TAMANO_BLOQUE]
+        base = (
+            bloque["fecha"]
+            + bloque["hora"]
+            + bloque["id_sensor"]
+            + bloque["ppm_benceno"].astype(str)
+        ).to_numpy()
+        hashes.extend(md5(s.encode("utf-8")).hexdigest() for s in base)
+    return hashes
+
+
+# ==========================
+# 1) GENERAR LOS REGISTROS
+# ==========================
+
+def generar_bloque_registros(
+    semilla: np.random.SeedSequence,
+    indice_inicial: int,
+    num_registros: int,
+    id_sensor: str,
+    id_micro: str,
+    id_linea: str,
+    id_fabrica: str,
+    fecha_inicial: datetime,
+) -> pd.DataFrame:
+    """
+    Genera un DataFrame con las lecturas indice_inicial .. indice_inicial + num_registros - 1
+    de la simulación. Cada columna se genera completa con NumPy en lugar de fila por fila.
+    """
+    rng = np.random.default_rng(semilla)
+
+    # timestamp de cada lectura: una cada 10 segundos a partir de la fecha inicial
+    instantes = (
+        np.datetime64(fecha_inicial, "s")
+        + np.arange(indice_inicial, indice_inicial + num_registros, dtype="int64")
+        * np.timedelta64(10, "s")
+    )
+
+    # fecha y hora como texto ISO ("AAAA-MM-DD" y "HH:MM:SS") sin crear objetos date/time por fila
+    dias = instantes.astype("datetime64[D]")
+    fecha = np.datetime_as_string(dias)
+
+    # hora: dígitos de los segundos desde la medianoche escritos en una matriz de bytes
+    horas, resto = np.divmod((instantes - dias).astype("int64"), 3600)
+    minutos, segundos = np.divmod(resto, 60)
+    caracteres = np.full((num_registros, 8), ord(":"), dtype=np.uint8)
+    for pos, valor in ((0, horas), (3, minutos), (6, segundos)):
+        caracteres[:, pos] = valor // 10 + ord("0")
+        caracteres[:, pos + 1] = valor % 10 + ord("0")
+    hora = caracteres.view("S8").ravel().astype("U8")
+
+    # ppm de benceno aleatorio (ejemplo: 0 a PPM_MAXIMO ppm)
+    # (se redondea sobre el mismo arreglo, sin crear uno temporal)
+    ppm = rng.uniform(0, PPM_MAXIMO, num_registros)
+    np.round(ppm, 2, out=ppm)
+
+    # clasificación según ppm
+    id_clasif = clasificar_ppm_vector(ppm)
+
+    # ubicación simulada (ejemplo: cerca de una coordenada base)
+    geo_lat = rng.uniform(-0.01, 0.01, num_registros)
+    geo_lon = rng.uniform(-0.01, 0.01, num_registros)
+    geo_alt = rng.uniform(-10, 10, num_registros)
+    geo_lat += 6.2442     # ej. cerca de Medellín
+    geo_lon += -75.5812
+    geo_alt += 1500       # metros
+
+    # variables ambientales
+    temperatura = rng.uniform(18, 35, num_registros)   # °C
+    humedad = rng.uniform(40, 90, num_registros)       # %
+    np.round(temperatura, 1, out=temperatura)
+    np.round(humedad, 1, out=humedad)
+
+    df = pd.DataFrame({
+        "fecha": fecha,
+        "hora": hora,
+        "id_sensor": id_sensor,
+        "id_micro": id_micro,
+        "id_linea": id_linea,
+        "id_fabrica": id_fabrica,
+        "ppm_benceno": ppm,
+        "id_clasificacion": id_clasif,
+        "geo_latitud": geo_lat,
+        "geo_longitud": geo_lon,
+        "geo_altitud": geo_alt,
+        "temperatura": temperatura,
+        "humedad": humedad,
+        "estado_transmision": "O",  # Un solo carácter para coincidir con character(1)
+        "timestamp_envio": instantes,
+        "observaciones": "",
+        "hash_integridad": "",    # se llena luego
+        "origen_formato": "simulacion_py",
+    })
+
+    # hash de integridad
+    df["hash_integridad"] = generar_hash_integridad(df)
+
+    return df
 
 
 def generar_registros_simulados(
@@ -71,106 +230,276 @@ def generar_registros_simulados(
     id_linea: str,
     id_fabrica: str,
     fecha_inicial: datetime,
-):
+) -> pd.DataFrame:
     """
-    Genera una lista de diccionarios con los registros simulados para la tabla 'lecturas'
+    Genera un DataFrame con los registros simulados para la tabla 'lecturas'
     y la hoja de cálculo 'lecturas-sensor'.
+    Con MIN_REGISTROS_PARALELO registros o más, se reparten en NUM_PROCESOS bloques
+    que se generan en paralelo, cada uno con su propio generador aleatorio.
     """
-    registros = []
-    instante = fecha_inicial
-
-    for i in range(num_registros):
-        # timestamp de la lectura
-        fecha = instante.date()
-        hora = instante.time()
-
-        # ppm de benceno aleatorio (ejemplo: 0 a 100 ppm, con sesgo hacia valores bajos)
-        ppm = round(random.uniform(0, 80), 2)
-
-        # clasificación según ppm
-        id_clasif = clasificar_ppm(ppm)
-
-        # ubicación simulada (ejemplo: cerca de una coordenada base)
-        geo_lat = 6.2442 + random.uniform(-0.01, 0.01)   # ej. cerca de Medellín
-        geo_lon = -75.5812 + random.uniform(-0.01, 0.01)
-        geo_alt = 1500 + random.uniform(-10, 10)         # metros
-
-        # variables ambientales
-        temperatura = round(random.uniform(18, 35), 1)   # °C
-        humedad = round(random.uniform(40, 90), 1)       # %
-
-        estado_tx = "O"  # Cambiado a un solo carácter para coincidir con character(1)
-        timestamp_envio = instante
-
-        observaciones = ""
-        origen_formato = "simulacion_py"
-
-        row = {
-            "fecha": fecha,
-            "hora": hora,
-            "id_sensor": id_sensor,
-            "id_micro": id_micro,
-            "id_linea": id_linea,
-            "id_fabrica": id_fabrica,
-            "ppm_benceno": ppm,
-            "id_clasificacion": id_clasif,
-            "geo_latitud": geo_lat,
-            "geo_longitud": geo_lon,
-            "geo_altitud": geo_alt,
-            "temperatura": temperatura,
-            "humedad": humedad,
-            "estado_transmision": estado_tx,
-            "timestamp_envio": timestamp_envio,
-            "observaciones": observaciones,
-            "hash_integridad": "",    # se llena luego
-            "origen_formato": origen_formato,
-        }
+    num_procesos = NUM_PROCESOS if num_registros >= MIN_REGISTROS_PARALELO else 1
+    semillas = np.random.SeedSequence().spawn(num_procesos)
 
-        # hash de integridad
-        row["hash_integridad"] = generar_hash_integridad(row)
+    if num_procesos == 1:
+        return generar_bloque_registros(
+            semillas[0], 0, num_registros, id_sensor, id_micro, id_linea, id_fabrica, fecha_inicial
+        )
 
-        registros.append(row)
+    base, sobrante = divmod(num_registros, num_procesos)
+    tamanos = [base + (i < sobrante) for i in range(num_procesos)]
+    inicios = [sum(tamanos[:i]) for i in range(num_procesos)]
+
+    with ProcessPoolExecutor(num_procesos) as ex:
+        partes = list(ex.map(
+            generar_bloque_registros,
+            semillas,
+            inicios,
+            tamanos,
+            repeat(id_sensor),
+            repeat(id_micro),
+            repeat(id_linea),
+            repeat(id_fabrica),
+            repeat(fecha_inicial),
+        ))
+
+    return pd.concat(partes, ignore_index=True)
 
-        # avanzar 10 segundos para la siguiente lectura
-        instante += timedelta(seconds=10)
+# ==========================
+# 2) GUARDAR EL ARCHIVO DE LECTURAS
+# ==========================
 
-    return registros
+def guardar_excel(df: pd.DataFrame, nombre_archivo: str):
+    """
+    Escribe el DataFrame en un libro de Excel en modo write_only de openpyxl,
+    fila por fila, sin pasar por el formateador de estilos de pandas.
+    """
+    # Convertir el timestamp a texto una sola vez, no celda por celda
+    # (fecha y hora ya vienen como texto desde generar_registros_simulados)
+    df = df.assign(timestamp_envio=df["timestamp_envio"].astype(str))
 
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("lecturas")
+    ws.append(list(df.columns))
+    for row in df.itertuples(index=False, name=None):
+        ws.append(row)
+    wb.save(nombre_archivo)
 
-# ==========================
-# 1) GENERAR LOS REGISTROS
-# ==========================
 
-registros = generar_registros_simulados(
-    NUM_REGISTROS,
-    ID_SENSOR,
-    ID_MICRO,
-    ID_LINEA,
-    ID_FABRICA,
-    FECHA_INICIAL,
-)
+def guardar_archivo_lecturas(df: pd.DataFrame) -> str:
+    """
+    Guarda las lecturas en el formato indicado por FORMATO_SALIDA y devuelve el nombre del archivo.
+    """
+    nombre_archivo_salida = f"lecturas-sensor_{ID_SENSOR}.{FORMATO_SALIDA}"
+
+    if FORMATO_SALIDA == "xlsx":
+        guardar_excel(df, nombre_archivo_salida)
+    elif FORMATO_SALIDA == "csv":
+        df.to_csv(nombre_archivo_salida, index=False)
+    elif FORMATO_SALIDA == "parquet":
+        df.to_parquet(nombre_archivo_salida, index=False, compression="zstd")
+    else:
+        raise ValueError(f"FORMATO_SALIDA no soportado: {FORMATO_SALIDA!r} (usa 'xlsx', 'csv' o 'parquet')")
 
-print(f"Se generaron {len(registros)} registros simulados.")
+    return nombre_archivo_salida
 
 # ==========================
-# 2) GUARDAR EN EXCEL
+# 3) INSERTAR EN POSTGRESQL
 # ==========================
 
-df = pd.DataFrame(registros)
+# Columnas de 'lecturas' en el orden en que se envían a PostgreSQL
+COLUMNAS_LECTURAS = [
+    "fecha",
+    "hora",
+    "id_sensor",
+    "id_micro",
+    "id_linea",
+    "id_fabrica",
+    "ppm_benceno",
+    "id_clasificacion",
+    "geo_latitud",
+    "geo_longitud",
+    "geo_altitud",
+    "temperatura",
+    "humedad",
+    "estado_transmision",
+    "timestamp_envio",
+    "observaciones",
+    "hash_integridad",
+    "origen_formato",
+]
+
+# Columnas que generar_registros_simulados llena con el mismo valor en todas las filas
+COLUMNAS_CONSTANTES = [
+    "id_sensor",
+    "id_micro",
+    "id_linea",
+    "id_fabrica",
+    "estado_transmision",
+    "observaciones",
+    "origen_formato",
+]
+
+# Opciones de DataFrame.to_csv para el COPY en texto (tabulado, \N para nulos)
+OPCIONES_CSV_COPY = dict(index=False, header=False, sep="\t", na_rep="\\N", lineterminator="\n")
+
+
+class FlujoCopy(io.RawIOBase):
+    """
+    Archivo de sólo lectura que entrega bajo demanda los bytes de un iterador,
+    para que COPY lea el CSV sin tenerlo completo en memoria.
+    """
 
-nombre_archivo_excel = f"lecturas-sensor_{ID_SENSOR}.xlsx"
-df.to_excel(nombre_archivo_excel, index=False)
+    def __init__(self, trozos):
+        self.trozos = iter(trozos)
+        self.pendiente = memoryview(b"")
 
-print(f"Archivo Excel generado: {nombre_archivo_excel}")
+    def readable(self):
+        return True
 
-# ==========================
-# 3) INSERTAR EN POSTGRESQL
-# ==========================
+    def readinto(self, b):
+        while not self.pendiente:
+            try:
+                self.pendiente = memoryview(next(self.trozos))
+            except StopIteration:
+                return 0
+        n = min(len(b), len(self.pendiente))
+        b[:n] = self.pendiente[:n]
+        self.pendiente = self.pendiente[n:]
+        return n
 
-def insertar_en_postgres(registros):
-    conn = psycopg2.connect(**DB_CONFIG)
-    cursor = conn.cursor()
 
+def iterar_bloques_csv(df: pd.DataFrame, columnas_variables: list, prefijo: str, codificacion: str):
+    """
+    Genera el CSV de COPY por bloques de TAMANO_BLOQUE filas, ya codificado en bytes
+    con la codificación de la conexión.
+    """
+    for inicio in range(0, len(df), TAMANO_BLOQUE):
+        bloque = df.iloc[inicio:inicio + TAMANO_BLOQUE]
+        cuerpo = bloque[columnas_variables].to_csv(**OPCIONES_CSV_COPY)
+        # Anteponer el prefijo constante a cada línea en una sola pasada
+        yield (prefijo + cuerpo[:-1].replace("\n", "\n" + prefijo) + "\n").encode(codificacion)
+
+
+def cargar_con_copy(cursor, df: pd.DataFrame):
+    """
+    Envía las lecturas con el protocolo COPY de PostgreSQL, generando el CSV por bloques
+    a medida que se envía. Las columnas constantes se formatean una sola vez y se
+    anteponen a cada línea.
+    """
+    if df.empty:
+        return
+
+    columnas_variables = [col for col in COLUMNAS_LECTURAS if col not in COLUMNAS_CONSTANTES]
+    columnas = COLUMNAS_CONSTANTES + columnas_variables
+
+    # NOTA: id_lectura es serial, NO se incluye en el COPY.
+    copy_query = f"""
+        COPY monitoreo_produccion.lecturas ({", ".join(columnas)})
+        FROM STDIN WITH (FORMAT csv, DELIMITER E'\\t', NULL '\\N')
+    """
+
+    prefijo = df[COLUMNAS_CONSTANTES].iloc[:1].to_csv(**OPCIONES_CSV_COPY).rstrip("\n") + "\t"
+    # Los bytes se envían tal cual: codificar como lo haría psycopg2 con un str (client_encoding)
+    codificacion = encodings[cursor.connection.encoding]
+    bloques = iterar_bloques_csv(df, columnas_variables, prefijo, codificacion)
+    cursor.copy_expert(copy_query, FlujoCopy(bloques))
+
+
+if CopyManager is not None:
+    class CopyManagerLecturas(CopyManager):
+        """
+        CopyManager de pgcopy que además acepta float en columnas numeric
+        y str en columnas character(n).
+        """
+        type_formatters = {
+            "numeric": lambda v: numeric_formatter(Decimal(repr(v))),
+        }
+
+        def get_formatter(self, att):
+            if att.type_name == "bpchar":
+                # Codificar con la misma codificación de la conexión que usa pgcopy para varchar/text
+                codificacion = encodings[self.conn.encoding]
+                return lambda v: str_formatter(v.encode(codificacion))
+            return super().get_formatter(att)
+
+
+def iterar_filas_binarias(df: pd.DataFrame):
+    """
+    Devuelve un iterador con las filas para el COPY binario, tomadas directamente
+    de las columnas del DataFrame, sin materializar la lista completa.
+    """
+    # Convertir los datetime64 a objetos de Python en bloque, una sola vez:
+    # fecha como date, y hora y timestamp_envio como datetime (el formateador
+    # 'time' de pgcopy sólo usa hour, minute, second y microsecond)
+    instantes = df["timestamp_envio"].to_numpy()
+    columnas = {col: df[col] for col in COLUMNAS_LECTURAS}
+    columnas["fecha"] = instantes.astype("datetime64[D]").astype(object)
+    columnas["hora"] = columnas["timestamp_envio"] = instantes.astype(object)
+
+    return zip(*(columnas[col] for col in COLUMNAS_LECTURAS))
+
+
+def cargar_con_copy_binario(cursor, df: pd.DataFrame):
+    """
+    Envía las lecturas con COPY ... WITH BINARY usando pgcopy. Las filas se serializan
+    a través de un pipe mientras otro hilo las envía, sin volcar antes todo el contenido
+    a un archivo.
+    """
+    mgr = CopyManagerLecturas(cursor.connection, "monitoreo_produccion.lecturas", COLUMNAS_LECTURAS)
+
+    # Igual que CopyManager.threading_copy, pero cerrando siempre el pipe: si una fila
+    # falla al serializarse, el hilo de envío recibe fin de datos en lugar de quedarse
+    # bloqueado esperando y el error se propaga.
+    r_fd, w_fd = os.pipe()
+    rstream = os.fdopen(r_fd, "rb")
+    errores_envio = []
+
+    def enviar():
+        try:
+            mgr.copystream(rstream)
+        except Exception as e:
+            errores_envio.append(e)
+        finally:
+            rstream.close()
+
+    hilo_envio = threading.Thread(target=enviar)
+    hilo_envio.start()
+    try:
+        with os.fdopen(w_fd, "wb") as wstream:
+            mgr.writestream(iterar_filas_binarias(df), wstream)
+    except BrokenPipeError:
+        # El envío terminó antes de tiempo: el error que importa es el del servidor
+        hilo_envio.join()
+        if errores_envio:
+            raise errores_envio[0]
+        raise
+    finally:
+        hilo_envio.join()
+
+    if errores_envio:
+        raise errores_envio[0]
+
+
+def cargar_con_execute_values(cursor, df: pd.DataFrame):
+    """
+    Envía las lecturas con INSERT ... VALUES por lotes (execute_values).
+    Las tuplas salen directamente de las columnas del DataFrame, sin diccionarios intermedios.
+    """
+    # NOTA: id_lectura es serial, NO se incluye en el INSERT.
+    insert_query = f"""
+        INSERT INTO monitoreo_produccion.lecturas ({", ".join(COLUMNAS_LECTURAS)})
+        VALUES %s
+    """
+
+    values = zip(*(df[col] for col in COLUMNAS_LECTURAS))
+    execute_values(cursor, insert_query, values, page_size=TAMANO_PAGINA_INSERT)
+
+
+def validar_ids_configurados(cursor):
+    """
+    Muestra los IDs disponibles en las tablas relacionadas y advierte si los
+    configurados no existen. Sólo se usa para depuración (VALIDAR_IDS).
+    """
     # Consultar qué IDs existen en las tablas relacionadas para validación
     try:
         cursor.execute("SELECT id_sensor FROM monitoreo_produccion.sensor LIMIT 10;")
@@ -202,63 +531,58 @@ def insertar_en_postgres(registros):
         print()
     except Exception as e:
         print(f"Error al consultar tablas relacionadas: {e}")
+        # Descartar la transacción abortada para que la inserción pueda continuar
+        cursor.connection.rollback()
         print("Continuando con la inserción...\n")
 
-    # NOTA: id_lectura es serial, NO se incluye en el INSERT.
-    insert_query = """
-        INSERT INTO monitoreo_produccion.lecturas (
-            fecha,
-            hora,
-            id_sensor,
-            id_micro,
-            id_linea,
-            id_fabrica,
-            ppm_benceno,
-            id_clasificacion,
-            geo_latitud,
-            geo_longitud,
-            geo_altitud,
-            temperatura,
-            humedad,
-            estado_transmision,
-            timestamp_envio,
-            observaciones,
-            hash_integridad,
-            origen_formato
-        ) VALUES %s
-    """
 
-    # Convertir lista de dicts a lista de tuplas en el orden correcto
-    values = [
-        (
-            r["fecha"],
-            r["hora"],
-            r["id_sensor"],
-            r["id_micro"],
-            r["id_linea"],
-            r["id_fabrica"],
-            r["ppm_benceno"],
-            r["id_clasificacion"],
-            r["geo_latitud"],
-            r["geo_longitud"],
-            r["geo_altitud"],
-            r["temperatura"],
-            r["humedad"],
-            r["estado_transmision"],
-            r["timestamp_envio"],
-            r["observaciones"],
-            r["hash_integridad"],
-            r["origen_formato"],
-        )
-        for r in registros
-    ]
+def insertar_en_postgres(df: pd.DataFrame):
+    conn = psycopg2.connect(**DB_CONFIG)
+    try:
+        # El bloque with hace commit al salir, o rollback si ocurre una excepción
+        with conn, conn.cursor() as cursor:
+            if VALIDAR_IDS:
+                validar_ids_configurados(cursor)
+
+            # Carga masiva: no esperar la escritura del WAL a disco en el commit
+            # (SET LOCAL sólo afecta a esta transacción)
+            cursor.execute("SET LOCAL synchronous_commit = off;")
+
+            if not USAR_COPY:
+                cargar_con_execute_values(cursor, df)
+            elif USAR_COPY_BINARIO and CopyManager is not None:
+                cargar_con_copy_binario(cursor, df)
+            else:
+                cargar_con_copy(cursor, df)
+    finally:
+        conn.close()
+    print(f"Se insertaron {len(df)} registros en monitoreo_produccion.lecturas")
 
-    execute_values(cursor, insert_query, values)
-    conn.commit()
-    cursor.close()
-    conn.close()
-    print(f"Se insertaron {len(registros)} registros en monitoreo_produccion.lecturas")
 
+# ==========================
+# PROGRAMA PRINCIPAL
+# ==========================
 
-# Llamar a la función de inserción
-insertar_en_postgres(registros)
\ No newline at end of file
+def main():
+    # 1) Generar los registros
+    df = generar_registros_simulados(
+        NUM_REGISTROS,
+        ID_SENSOR,
+        ID_MICRO,
+        ID_LINEA,
+        ID_FABRICA,
+        FECHA_INICIAL,
+    )
+    print(f"Se generaron {len(df)} registros simulados.")
+
+    # 2) Guardar el archivo de lecturas
+    nombre_archivo_salida = guardar_archivo_lecturas(df)
+    print(f"Archivo de lecturas generado: {nombre_archivo_salida}")
+
+    # 3) Insertar en PostgreSQL
+    insertar_en_postgres(df)
+
+
+# El guard es necesario: los procesos de ProcessPoolExecutor vuelven a importar este módulo
+if __name__ == "__main__":
+    main()
\ No newline at end of file